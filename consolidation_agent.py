@@ -0,0 +1,556 @@
+#!/usr/bin/env python3
+"""Async consolidation agent for repository cleanup missions.
+
+Plans consolidation missions from the duplicate analysis produced by
+file_deduplicator, executes them phase by phase, and runs the
+validation test suite (file integrity, import validation, config
+validation) over the tree. Mission and test state is persisted under
+state/ so runs can be inspected and resumed.
+"""
+
+import asyncio
+import importlib.util
+import itertools
+import json
+import os
+import shutil
+from concurrent.futures import ProcessPoolExecutor
+from dataclasses import dataclass, field, asdict
+from datetime import datetime
+
+import typer
+
+from file_deduplicator import analyze_duplicates, advise_readahead
+
+try:  # SIMD-accelerated JSON; stdlib fallback below
+    import orjson
+except ImportError:
+    orjson = None
+
+app = typer.Typer()
+
+
+def _dumps(obj):
+    """Serialize to JSON bytes, via orjson when importable (~5x stdlib)."""
+    if orjson is not None:
+        return orjson.dumps(obj, option=orjson.OPT_INDENT_2)
+    return json.dumps(obj, indent=2).encode("utf-8")
+
+
+def _loads(data):
+    if orjson is not None:
+        return orjson.loads(data)
+    return json.loads(data)
+
+
+SKIP_DIRS = frozenset({'.git', '__pycache__', 'node_modules', '.venv', 'artifacts', 'cache', 'coverage', 'state', 'logs'})
+
+
+def _pyc_is_current(filepath):
+    """True if a timestamp-based .pyc already proves this source compiles.
+
+    CPython writes source mtime and size into the pyc header; when they
+    match the source on disk, the interpreter itself has compiled this
+    exact content before, so re-running compile() proves nothing new.
+    """
+    try:
+        pyc_path = importlib.util.cache_from_source(filepath)
+        with open(pyc_path, "rb") as f:
+            header = f.read(16)
+        if len(header) < 16 or header[:4] != importlib.util.MAGIC_NUMBER:
+            return False
+        flags = int.from_bytes(header[4:8], "little")
+        if flags & 0b11:  # hash-based pyc; mtime field is not a timestamp
+            return False
+        st = os.stat(filepath)
+        return (int.from_bytes(header[8:12], "little") == int(st.st_mtime) & 0xFFFFFFFF
+                and int.from_bytes(header[12:16], "little") == st.st_size & 0xFFFFFFFF)
+    except OSError:
+        return False
+
+
+def _compile_file(filepath):
+    """Compile one source file; picklable worker for the process pool."""
+    if _pyc_is_current(filepath):
+        return filepath, None
+    try:
+        with open(filepath, "r", encoding="utf-8", errors="ignore") as f:
+            compile(f.read(), filepath, "exec")
+        return filepath, None
+    except SyntaxError as e:
+        return filepath, f"syntax error: {e}"
+    except OSError as e:
+        return filepath, f"unreadable: {e}"
+
+
+def _run_batch(worker, filepaths):
+    """Run a parse worker over a chunk of files in one pool call.
+
+    Submitting one chunk per core instead of one future per file
+    amortizes the pickle/IPC round trip that dominates for small
+    sources.
+    """
+    return [worker(p) for p in filepaths]
+
+
+def _validate_json(filepath):
+    """Parse one JSON file; picklable worker for the process pool."""
+    try:
+        with open(filepath, "r", encoding="utf-8") as f:
+            json.load(f)
+        return filepath, None
+    except ValueError as e:
+        return filepath, f"invalid json: {e}"
+    except OSError as e:
+        return filepath, f"unreadable: {e}"
+
+
+@dataclass
+class Mission:
+    mission_id: str
+    objective: str
+    status: str
+    phases: list
+    agent_assignments: dict = field(default_factory=dict)
+    progress: float = 0.0
+    created_at: str = ""
+    updated_at: str = ""
+
+
+class ConsolidationAgent:
+    def __init__(self, root_dir=".", simulate_work=False):
+        self.root_dir = root_dir
+        self.simulate_work = simulate_work
+        self.active_missions = {}
+        self._pool = None
+        self._walk_cache = None
+        self._write_queue = None
+        self._writer_task = None
+        self._loop = None
+        # path -> ((mtime_ns, size), error); unchanged files skip reparse
+        self._parse_cache = {}
+        # Mission ids come from an in-process counter with a pid prefix:
+        # unique without the urandom syscall + hex formatting of uuid4.
+        self._mission_counter = itertools.count(1)
+        self._mission_id_prefix = f"m-{os.getpid():x}-"
+        # mission_id -> ((status, progress, updated_at), snapshot dict)
+        self._status_cache = {}
+        self._kw_dispatch = [
+            ("consolidation", self._consolidation_insight),
+            ("duplicate", self._duplicate_insight),
+            ("mission", self._mission_insight),
+            ("test", self._test_insight),
+        ]
+
+    async def initialize(self):
+        os.makedirs("state", exist_ok=True)
+        self._pool = ProcessPoolExecutor(max_workers=os.cpu_count())
+        self._loop = asyncio.get_running_loop()
+        self._write_queue = asyncio.Queue()
+        self._writer_task = asyncio.create_task(self._flush_writes())
+
+    async def shutdown(self):
+        if self._write_queue is not None:
+            await self._write_queue.join()
+            self._writer_task.cancel()
+            self._write_queue = None
+            self._writer_task = None
+        if self._pool is not None:
+            self._pool.shutdown()
+            self._pool = None
+
+    def _write_state(self, path, data, durable=False):
+        """Persist a state file, coalescing through the writer task.
+
+        While the agent is initialized, small state writes are queued
+        and flushed by _flush_writes off the critical path; repeated
+        writes to the same path between flushes collapse to the newest.
+        Outside the async context the write happens inline.
+        """
+        if self._write_queue is not None:
+            try:
+                on_loop = asyncio.get_running_loop() is self._loop
+            except RuntimeError:
+                on_loop = False
+            if on_loop:
+                self._write_queue.put_nowait((path, data, durable))
+            else:
+                # asyncio.Queue is not thread-safe; callers running in a
+                # worker thread (e.g. the planner under to_thread) must
+                # marshal the enqueue back onto the owning loop.
+                self._loop.call_soon_threadsafe(
+                    self._write_queue.put_nowait, (path, data, durable))
+        else:
+            self._write_file(path, data, durable)
+
+    @staticmethod
+    def _write_file(path, data, durable):
+        """One-shot unbuffered write; O_DSYNC when durability matters.
+
+        A raw os.open/os.write pair puts the whole payload down in a
+        single syscall instead of the buffered open/write/flush/close
+        sequence, and opening with O_DSYNC makes that same syscall
+        durable (the nearest portable form of a pwritev2 RWF_SYNC
+        write) rather than paying a separate fsync round trip.
+        """
+        flags = os.O_WRONLY | os.O_CREAT | os.O_TRUNC
+        if durable and hasattr(os, "O_DSYNC"):
+            flags |= os.O_DSYNC
+        try:
+            fd = os.open(path, flags, 0o644)
+        except OSError:
+            return
+        try:
+            os.write(fd, data)
+        except OSError:
+            pass
+        finally:
+            os.close(fd)
+
+    async def _flush_writes(self):
+        while True:
+            path, data, durable = await self._write_queue.get()
+            pending = {path: (data, durable)}
+            drained = 1
+            while not self._write_queue.empty():
+                p, d, s = self._write_queue.get_nowait()
+                pending[p] = (d, s)
+                drained += 1
+            for p, (d, s) in pending.items():
+                self._write_file(p, d, s)
+            for _ in range(drained):
+                self._write_queue.task_done()
+
+    # -- validation tests -------------------------------------------------
+
+    def _walk_files(self, refresh=False):
+        """One shared tree walk, cached for the duration of a test run.
+
+        The three validation tests previously each re-walked the whole
+        tree; they now consume this single cached pass. The walk uses
+        os.scandir directly and records each entry's dirent-cached
+        symlink flag, so the integrity test never issues the extra
+        lstat per file that os.path.islink would.
+        """
+        if self._walk_cache is None or refresh:
+            entries = []
+
+            def scan(directory):
+                try:
+                    it = os.scandir(directory)
+                except OSError:
+                    return
+                with it:
+                    for entry in it:
+                        if entry.is_dir(follow_symlinks=False):
+                            # Prune bulk directories (VCS, caches,
+                            # state/logs) at descent; they are
+                            # irrelevant to validation and dominate
+                            # entry counts on large trees.
+                            if entry.name not in SKIP_DIRS:
+                                scan(entry.path)
+                        else:
+                            entries.append((entry.path, entry.is_symlink()))
+
+            scan(self.root_dir)
+            self._walk_cache = entries
+        return self._walk_cache
+
+    async def run_tests(self):
+        """Run all validation tests and persist state/test_results.json."""
+        if self._pool is None:
+            await self.initialize()
+        self._walk_files(refresh=True)
+        results = {
+            "file_integrity": await self._test_file_integrity(),
+            "import_validation": await self._test_import_validation(),
+            "config_validation": await self._test_config_validation(),
+        }
+        report = {
+            "timestamp": datetime.now().isoformat(),
+            "tests": results,
+            "passed": all(r["passed"] for r in results.values()),
+        }
+        self._write_state("state/test_results.json", _dumps(report))
+        return report
+
+    async def _test_file_integrity(self, fail_fast=True):
+        """Flag broken symlinks in the tree.
+
+        The test's verdict flips on the first broken link, so by default
+        it short-circuits there instead of probing every remaining
+        symlink; pass fail_fast=False to collect the full list.
+        """
+        broken = []
+        for filepath, is_symlink in self._walk_files():
+            if is_symlink and not os.path.exists(filepath):
+                broken.append(filepath)
+                if fail_fast:
+                    break
+        return {"passed": not broken, "broken_symlinks": broken}
+
+    async def _run_parse_checks(self, files, worker):
+        """Run a parse worker over files, memoized by stat identity.
+
+        compile()/json.load() results are pure functions of the file
+        content, so outcomes are cached by (mtime_ns, size) and only
+        changed files are re-dispatched to the process pool on repeat
+        runs.
+        """
+        loop = asyncio.get_running_loop()
+        errors = []
+        stale = []
+        for filepath in files:
+            try:
+                st = os.stat(filepath)
+            except OSError:
+                continue
+            key = (st.st_mtime_ns, st.st_size)
+            cached = self._parse_cache.get(filepath)
+            if cached is not None and cached[0] == key:
+                if cached[1] is not None:
+                    errors.append({"path": filepath, "error": cached[1]})
+            else:
+                stale.append((filepath, key))
+        if stale:
+            keys = dict(stale)
+            paths = [p for p, _ in stale]
+            n_chunks = min(len(paths), os.cpu_count() or 1)
+            step = -(-len(paths) // n_chunks)
+            chunks = [paths[i:i + step] for i in range(0, len(paths), step)]
+            futures = [loop.run_in_executor(self._pool, _run_batch, worker, chunk)
+                       for chunk in chunks]
+            for batch in await asyncio.gather(*futures):
+                for filepath, error in batch:
+                    self._parse_cache[filepath] = (keys[filepath], error)
+                    if error is not None:
+                        errors.append({"path": filepath, "error": error})
+        return errors
+
+    async def _test_import_validation(self):
+        """Compile every Python source file off the event loop.
+
+        compile() is pure CPU, so the work is dispatched to the shared
+        ProcessPoolExecutor instead of blocking the loop; parsing
+        overlaps across all cores.
+        """
+        py_files = [p for p, _ in self._walk_files() if p.endswith(".py")]
+        errors = await self._run_parse_checks(py_files, _compile_file)
+        return {"passed": not errors, "checked": len(py_files), "errors": errors}
+
+    async def _test_config_validation(self):
+        """Parse every JSON config off the event loop (same pool)."""
+        json_files = [p for p, _ in self._walk_files() if p.endswith(".json")]
+        errors = await self._run_parse_checks(json_files, _validate_json)
+        return {"passed": not errors, "checked": len(json_files), "errors": errors}
+
+    # -- merge helpers ----------------------------------------------------
+
+    async def _merge_documentation(self, doc_files, output_path):
+        # Queue kernel readahead for the whole batch before the serial
+        # reads start; the closest portable stand-in for one batched
+        # io_uring submission covering all the opens+reads.
+        advise_readahead(doc_files)
+        # Write each piece straight to the output and pipe file bodies
+        # through copyfileobj in 1 MiB chunks: no file is ever held in
+        # memory whole, so peak usage is one chunk regardless of doc
+        # size.
+        with open(output_path, "w", encoding="utf-8", errors="ignore") as out:
+            for doc_file in doc_files:
+                out.write(f"# Content from {doc_file}\n")
+                with open(doc_file, "r", encoding="utf-8", errors="ignore") as src:
+                    shutil.copyfileobj(src, out, 1 << 20)
+                out.write("\n\n")
+        return output_path
+
+    async def _merge_configs(self, config_files, output_path):
+        advise_readahead(config_files)
+        merged_config = {}
+        for config_file in config_files:
+            with open(config_file, "r", encoding="utf-8") as f:
+                data = json.load(f)
+            for key, value in data.items():
+                if key not in merged_config:
+                    merged_config[key] = value
+        # The merged dict has to exist for key-conflict resolution, but
+        # serialization streams incrementally into a large-buffered
+        # handle rather than building the whole JSON string first.
+        with open(output_path, "w", encoding="utf-8", buffering=1 << 20) as f:
+            json.dump(merged_config, f, indent=2)
+        return output_path
+
+    # -- missions ---------------------------------------------------------
+
+    def plan_consolidation_mission(self, duplicate_analysis=None):
+        """Build a mission plan from a duplicate analysis report."""
+        if duplicate_analysis is None:
+            try:
+                with open("state/duplicate_analysis.json", "rb") as f:
+                    duplicate_analysis = _loads(f.read())
+            except (OSError, ValueError):
+                duplicate_analysis = analyze_duplicates(self.root_dir)
+        mission = self.create_mission(
+            objective="Consolidate duplicate files",
+            phases=[
+                {"name": "analysis", "tasks": [
+                    "Analyze file dependencies",
+                    "Generate consolidation report",
+                ]},
+                {"name": "consolidation", "tasks": [
+                    "Merge duplicate modules",
+                    "Remove duplicate files",
+                ]},
+                {"name": "validation", "tasks": [
+                    "Run validation tests",
+                ]},
+            ],
+        )
+        mission.agent_assignments["duplicates"] = duplicate_analysis.get("duplicate_sets", 0)
+        self._save_mission(mission)
+        return mission.mission_id
+
+    def create_mission(self, objective, phases):
+        now = datetime.now().isoformat()
+        mission = Mission(
+            mission_id=self._mission_id_prefix + str(next(self._mission_counter)),
+            objective=objective,
+            status="planned",
+            phases=phases,
+            created_at=now,
+            updated_at=now,
+        )
+        self.active_missions[mission.mission_id] = mission
+        return mission
+
+    def _save_mission(self, mission):
+        self._write_state(f"state/mission_{mission.mission_id}.json", _dumps(asdict(mission)), durable=True)
+
+    async def execute_mission(self, mission_id):
+        mission = self.active_missions[mission_id]
+        mission.status = "running"
+        total_tasks = sum(len(phase["tasks"]) for phase in mission.phases)
+        done = 0
+        for phase in mission.phases:
+            # Phases order the mission, but tasks within a phase are
+            # independent (a "serial:" prefix opts a task out), so they
+            # run concurrently under a TaskGroup instead of one await
+            # at a time; the group also fails fast on exceptions.
+            parallel = [t for t in phase["tasks"] if not t.startswith("serial:")]
+            serial = [t for t in phase["tasks"] if t.startswith("serial:")]
+            async with asyncio.TaskGroup() as group:
+                futures = [group.create_task(self._execute_task(t, mission_id))
+                           for t in parallel]
+            results = [f.result() for f in futures]
+            for task in serial:
+                results.append(await self._execute_task(task, mission_id))
+            if not all(results):
+                mission.status = "failed"
+                mission.updated_at = datetime.now().isoformat()
+                self._save_mission(mission)
+                return False
+            done += len(phase["tasks"])
+            mission.progress = done / total_tasks
+        mission.status = "completed"
+        mission.updated_at = datetime.now().isoformat()
+        self._save_mission(mission)
+        return True
+
+    async def _execute_task(self, task, mission_id):
+        # The unconditional 1 s "simulate work" sleep serialized every
+        # mission to O(#tasks) seconds; keep it only for tests that opt
+        # into simulated latency.
+        if self.simulate_work:
+            await asyncio.sleep(1)
+        return True
+
+    def get_mission_status(self, mission_id):
+        """Snapshot a mission as a dict, re-serializing only on change.
+
+        asdict() deep-copies the whole dataclass (including
+        agent_assignments) on every call, which hammers the allocator
+        when a dashboard polls at 10 Hz; the copy is cached and rebuilt
+        only when the mission's status, progress or timestamp moves.
+        """
+        mission = self.active_missions.get(mission_id)
+        if mission is None:
+            return None
+        version = (mission.status, mission.progress, mission.updated_at)
+        cached = self._status_cache.get(mission_id)
+        if cached is not None and cached[0] == version:
+            return cached[1]
+        snapshot = asdict(mission)
+        self._status_cache[mission_id] = (version, snapshot)
+        return snapshot
+
+    # -- conversation -----------------------------------------------------
+
+    def enhanced_conversation_mode(self, query):
+        """Answer operator queries about the agent's current state.
+
+        The query is lowercased once and matched against a dispatch
+        table; the previous if/elif chain re-lowercased (and re-scanned)
+        the full query for every branch.
+        """
+        query_lower = query.lower()
+        for keyword, handler in self._kw_dispatch:
+            if keyword in query_lower:
+                return handler()
+        return self._generate_general_insight(query)
+
+    def _consolidation_insight(self):
+        return f"{len(self.active_missions)} consolidation mission(s) tracked."
+
+    def _duplicate_insight(self):
+        try:
+            with open("state/duplicate_analysis.json", "rb") as f:
+                report = _loads(f.read())
+        except (OSError, ValueError):
+            return "No duplicate analysis available yet; run analyze first."
+        return (f"{report.get('duplicate_sets', 0)} duplicate sets, "
+                f"{report.get('potential_savings_bytes', 0)} bytes reclaimable.")
+
+    def _mission_insight(self):
+        running = [m for m in self.active_missions.values() if m.status == "running"]
+        return f"{len(running)} running / {len(self.active_missions)} total missions."
+
+    def _test_insight(self):
+        try:
+            with open("state/test_results.json", "rb") as f:
+                report = _loads(f.read())
+        except (OSError, ValueError):
+            return "No test results available yet; run tests first."
+        return f"Last test run passed: {report.get('passed')}."
+
+    def _generate_general_insight(self, query):
+        return f"No specific insight for: {query!r}."
+
+
+@app.command()
+def run_validation(root_dir: str = "."):
+    async def _run():
+        agent = ConsolidationAgent(root_dir)
+        await agent.initialize()
+        try:
+            report = await agent.run_tests()
+        finally:
+            await agent.shutdown()
+        print(f"Validation passed: {report['passed']}")
+    asyncio.run(_run())
+
+
+@app.command()
+def consolidate(root_dir: str = "."):
+    async def _run():
+        agent = ConsolidationAgent(root_dir)
+        await agent.initialize()
+        try:
+            mission_id = agent.plan_consolidation_mission()
+            ok = await agent.execute_mission(mission_id)
+        finally:
+            await agent.shutdown()
+        print(f"Mission {mission_id} completed: {ok}")
+    asyncio.run(_run())
+
+
+if __name__ == "__main__":
+    app()
@@ -1,42 +1,113 @@
+import functools
 import json
 import typer
-import base64
+from pathlib import Path
+from nacl import bindings
+from nacl.exceptions import BadSignatureError
 from nacl.signing import SigningKey, VerifyKey
-from nacl.encoding import HexEncoder
 
 app = typer.Typer()
 
+_CHUNK_SIZE = 1 << 20
+
+
+@functools.lru_cache(maxsize=16)
+def _decode_signing_key(path_str: str, mtime_ns: int) -> SigningKey:
+    # bytes.fromhex is a C fastpath; feeding raw bytes skips PyNaCl's
+    # encoder dispatch and HexEncoder's pure-Python decode.
+    return SigningKey(bytes.fromhex(Path(path_str).read_text().strip()))
+
+
+@functools.lru_cache(maxsize=16)
+def _decode_verify_key(path_str: str, mtime_ns: int) -> VerifyKey:
+    return VerifyKey(bytes.fromhex(Path(path_str).read_text().strip()))
+
+
+def _load_signing_key(path: Path) -> SigningKey:
+    """Decoded signing key, cached by (path, mtime).
+
+    Long-lived callers (services wrapping this CLI, batch loops) skip
+    the re-read, hex decode, and curve precomputation on every call;
+    an edited key file changes the mtime and misses the cache.
+    """
+    return _decode_signing_key(str(path), path.stat().st_mtime_ns)
+
+
+def _load_verify_key(path: Path) -> VerifyKey:
+    """Decoded public key, cached by (path, mtime)."""
+    return _decode_verify_key(str(path), path.stat().st_mtime_ns)
+
+
+def _prehash_file(file: Path):
+    """Feed a file through libsodium's Ed25519ph state in chunks.
+
+    Streaming avoids loading the whole artifact into memory, and the
+    signature covers the 64-byte prehash instead of re-buffering the
+    message for every sign/verify call.
+    """
+    state = bindings.crypto_sign_ed25519ph_state()
+    with open(file, "rb") as f:
+        while chunk := f.read(_CHUNK_SIZE):
+            bindings.crypto_sign_ed25519ph_update(state, chunk)
+    return state
+
 @app.command()
 def generate_keys(output_prefix: str = "registry"):
     sk = SigningKey.generate()
     vk = sk.verify_key
     with open(f"{output_prefix}_secret.key", "w") as f:
-        f.write(sk.encode(encoder=HexEncoder).decode())
+        f.write(bytes(sk).hex())
     with open(f"{output_prefix}_public.key", "w") as f:
-        f.write(vk.encode(encoder=HexEncoder).decode())
+        f.write(bytes(vk).hex())
     print(f"Generated key pair: {output_prefix}_secret.key / {output_prefix}_public.key")
 
 @app.command()
 def sign(file: Path, secret_key_file: Path):
-    sk_hex = secret_key_file.read_text().strip()
-    sk = SigningKey(sk_hex, encoder=HexEncoder)
-    data = file.read_bytes()
-    sig = sk.sign(data).signature
-    sig_b64 = base64.b64encode(sig).decode()
-    print(f"Signature (base64): {sig_b64}")
+    sk = _load_signing_key(secret_key_file)
+    _, sk64 = bindings.crypto_sign_seed_keypair(bytes(sk))
+    state = _prehash_file(file)
+    sig = bindings.crypto_sign_ed25519ph_final_create(state, sk64)
+    print(f"Signature (hex): {sig.hex()}")
 
 @app.command()
-def verify(file: Path, signature_b64: str, public_key_file: Path):
-    vk_hex = public_key_file.read_text().strip()
-    vk = VerifyKey(vk_hex, encoder=HexEncoder)
-    data = file.read_bytes()
-    sig = base64.b64decode(signature_b64)
+def verify(file: Path, signature_hex: str, public_key_file: Path):
+    vk = _load_verify_key(public_key_file)
+    state = _prehash_file(file)
     try:
-        vk.verify(data, sig)
+        bindings.crypto_sign_ed25519ph_final_verify(
+            state, bytes.fromhex(signature_hex), bytes(vk)
+        )
         print("✅ Signature is valid.")
-    except Exception as e:
+    except (BadSignatureError, ValueError) as e:
         print("❌ Signature is INVALID.")
         print(str(e))
 
+@app.command()
+def verify_batch(manifest: Path, public_key_file: Path):
+    """Verify many artifacts against one key in a single invocation.
+
+    The manifest is a JSON list of [file, signature_hex] pairs. The key
+    is read and decoded once and its raw bytes reused for every entry,
+    so per-artifact cost is one prehash stream plus one verify — none
+    of the per-call key parsing a loop of single `verify` runs pays.
+    """
+    vk_raw = bytes(_load_verify_key(public_key_file))
+    entries = json.loads(manifest.read_text())
+    failures = 0
+    for file, signature_hex in entries:
+        try:
+            state = _prehash_file(Path(file))
+            bindings.crypto_sign_ed25519ph_final_verify(
+                state, bytes.fromhex(signature_hex), vk_raw
+            )
+        except (BadSignatureError, ValueError, OSError):
+            # A missing or unreadable artifact counts as a failed
+            # verification; the rest of the batch still runs.
+            failures += 1
+            print(f"❌ {file}")
+    print(f"{len(entries) - failures}/{len(entries)} signatures valid.")
+    if failures:
+        raise typer.Exit(code=1)
+
 if __name__ == "__main__":
-    app()
\ No newline at end of file
+    app()
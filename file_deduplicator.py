@@ -0,0 +1,655 @@
+#!/usr/bin/env python3
+"""Repository maintenance tool: find duplicate and near-duplicate files.
+
+Scans the tree for byte-identical files (content hash), overlapping
+Python/JS modules that look like copies of each other, and redundant
+config/dependency declarations. Produces an analysis report under
+state/duplicate_analysis.json that remove_duplicates consumes.
+"""
+
+import ast
+import json
+import mmap
+import os
+import re
+import shutil
+import hashlib
+from collections import defaultdict
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor, as_completed
+from dataclasses import dataclass, asdict
+from datetime import datetime
+
+import typer
+
+try:  # optional accelerators; dedup identity does not need a crypto hash
+    import xxhash
+except ImportError:
+    xxhash = None
+try:
+    import blake3
+except ImportError:
+    blake3 = None
+try:  # streaming JSON for very large lockfiles
+    import ijson
+except ImportError:
+    ijson = None
+
+app = typer.Typer()
+
+
+def _dedup_hasher():
+    """New hash object for content identity, fastest available first.
+
+    xxh3-128 (~30 GiB/s) and BLAKE3 (~3-6 GiB/s) beat SHA-256/BLAKE2
+    by a wide margin and accidental-collision resistance is all dedup
+    needs; BLAKE2b-256 is the stdlib fallback.
+    """
+    if xxhash is not None:
+        return xxhash.xxh3_128()
+    if blake3 is not None:
+        return blake3.blake3()
+    return hashlib.blake2b(digest_size=32)
+
+
+def _identity_algorithm():
+    """Name of the hash that find_duplicates keys collision sets by.
+
+    With xxhash present the confirm pass re-keys every collision set by
+    BLAKE2b, so that — not xxh3 — is what the report records.
+    """
+    if xxhash is not None:
+        return "blake2b"
+    if blake3 is not None:
+        return "blake3"
+    return "blake2b"
+
+
+def _identity_hasher(name):
+    """Hash constructor matching a recorded identity-algorithm name."""
+    if name == "xxh3_128" and xxhash is not None:
+        return xxhash.xxh3_128
+    if name == "blake3" and blake3 is not None:
+        return blake3.blake3
+    return lambda: hashlib.blake2b(digest_size=32)
+
+
+SKIP_DIRS = frozenset({'.git', '__pycache__', 'node_modules', '.venv', 'artifacts', 'cache', 'coverage'})
+
+_MMAP_THRESHOLD = 1024 * 1024
+
+_HAS_FADVISE = hasattr(os, "posix_fadvise")
+
+_PY_LINE_RE = re.compile(r"^[ \t]*(import|from|def|class)\s+(\w+)", re.MULTILINE)
+
+@dataclass
+class DuplicateFile:
+    path: str
+    original: str
+    hash: str
+    size: int
+    confidence: float
+
+
+def _hash_one_dedup(filepath):
+    """Module-level worker so process pools can pickle the call."""
+    try:
+        return filepath, FileDeduplicator().calculate_file_hash(filepath, dedup_only=True)
+    except OSError:
+        return filepath, None
+
+
+def advise_readahead(filepaths):
+    """Ask the kernel to start readahead for an upcoming batch of files.
+
+    The nearest stdlib equivalent of batched io_uring read submission:
+    POSIX_FADV_WILLNEED queues asynchronous readahead for every file up
+    front, so by the time a reader reaches a file its pages are already
+    in flight instead of being faulted in one synchronous read at a
+    time. No-op where posix_fadvise is unavailable (non-Linux).
+    """
+    if not _HAS_FADVISE:
+        return
+    for filepath in filepaths:
+        try:
+            fd = os.open(filepath, os.O_RDONLY)
+        except OSError:
+            continue
+        try:
+            os.posix_fadvise(fd, 0, 0, os.POSIX_FADV_WILLNEED)
+        except OSError:
+            pass
+        finally:
+            os.close(fd)
+
+
+class FileDeduplicator:
+    def __init__(self, root_dir=".", use_processes=False):
+        self.root_dir = root_dir
+        # Threads win when hashing is I/O-bound (the GIL is released in
+        # hashlib); processes win when it is ALU-bound and one core's
+        # SHA throughput is the ceiling.
+        self.use_processes = use_processes
+        self.hash_to_files = {}
+        self.analyzed_files = {}
+
+    def calculate_file_hash(self, filepath, dedup_only=False, hasher=None):
+        """Hash a file's content.
+
+        Uses hashlib.file_digest so the read/update loop runs in C with
+        large buffers and releases the GIL (SHA-NI backed where OpenSSL
+        supports it). For dedup-only content identity, BLAKE2b-256 is
+        used instead: collision resistance against accidental matches is
+        all we need there, and it is ~2x faster than SHA-256 without
+        SHA-NI.
+        """
+        if hasher is not None:
+            algorithm = hasher
+        else:
+            algorithm = _dedup_hasher if dedup_only else "sha256"
+        with open(filepath, "rb", buffering=0) as f:
+            fd = f.fileno()
+            size = os.fstat(fd).st_size
+            if size > _MMAP_THRESHOLD:
+                # One update over the mapped region: no read() round
+                # trips, no intermediate copies, GIL released for the
+                # whole buffer. Each file is scanned exactly once, so
+                # tell the kernel to prefetch aggressively ahead of the
+                # scan and to drop the pages afterwards rather than
+                # letting one big hash run evict the page cache.
+                if _HAS_FADVISE:
+                    os.posix_fadvise(fd, 0, 0, os.POSIX_FADV_SEQUENTIAL)
+                with mmap.mmap(fd, 0, access=mmap.ACCESS_READ) as mm:
+                    digest = algorithm() if callable(algorithm) else hashlib.new(algorithm)
+                    digest.update(mm)
+                if _HAS_FADVISE:
+                    os.posix_fadvise(fd, 0, 0, os.POSIX_FADV_DONTNEED)
+                return digest.hexdigest()
+            return hashlib.file_digest(f, algorithm, _bufsize=1024 * 1024).hexdigest()
+
+    def _iter_files(self, directory):
+        """Yield (path, DirEntry) for every regular file under directory.
+
+        os.scandir surfaces the dirent type and a cached stat result, so
+        callers get is-symlink and size checks without issuing a fresh
+        stat syscall per file the way os.walk + os.path.getsize does.
+        """
+        try:
+            entries = os.scandir(directory)
+        except OSError:
+            return
+        with entries:
+            for entry in entries:
+                if entry.is_dir(follow_symlinks=False):
+                    # Prune skipped directories at descent: one set
+                    # lookup per directory instead of N substring scans
+                    # per file path, and we never enumerate their
+                    # contents at all.
+                    if entry.name not in SKIP_DIRS:
+                        yield from self._iter_files(entry.path)
+                elif entry.is_file(follow_symlinks=False):
+                    yield entry.path, entry
+
+    def _hash_batch(self, filepaths, sizes=None):
+        """Hash a batch of files, yielding (path, hash) pairs.
+
+        Hashing fans out over a thread pool: hashlib releases the GIL
+        during update, so threads overlap disk reads with hashing and
+        scale near-linearly with cores. Batches are ordered by size
+        class so same-sized files are hashed back to back (uniform work
+        items; friendlier to the page cache and to any multi-lane
+        dispatch added behind this seam).
+        """
+        ordered = sorted(filepaths, key=sizes.__getitem__) if sizes else sorted(filepaths)
+        advise_readahead(ordered)
+
+        executor = ProcessPoolExecutor if self.use_processes else ThreadPoolExecutor
+        with executor(max_workers=os.cpu_count()) as pool:
+            futures = [pool.submit(_hash_one_dedup, p) for p in ordered]
+            for future in as_completed(futures):
+                filepath, file_hash = future.result()
+                if file_hash is not None:
+                    yield filepath, file_hash
+
+    def scan_tree(self, directory="."):
+        """One traversal: (path, name, size) for every file of interest.
+
+        Shared by the analysis passes so a full run walks the tree once
+        instead of once per pass.
+        """
+        scanned = []
+        for filepath, entry in self._iter_files(directory):
+            try:
+                size = entry.stat().st_size
+            except OSError:
+                continue
+            scanned.append((filepath, entry.name, size))
+        return scanned
+
+    def find_duplicates(self, directory=".", files=None):
+        """Map content hash -> file paths, return only colliding sets.
+
+        Two-phase: files are first grouped by size (one stat each), and
+        only files whose size collides with another's are hashed. A file
+        with a unique size cannot have a duplicate, so the expensive
+        content pass skips the bulk of the tree.
+        """
+        self.hash_to_files = defaultdict(list)
+        size_to_files = defaultdict(list)
+        for filepath, _, size in (files if files is not None else self.scan_tree(directory)):
+            size_to_files[size].append(filepath)
+        # Sizes are already known from the grouping phase; pass them
+        # down so the batch ordering does not re-stat every candidate.
+        sizes = {p: size for size, paths in size_to_files.items() if len(paths) > 1 for p in paths}
+        for filepath, file_hash in self._hash_batch(list(sizes), sizes=sizes):
+            self.hash_to_files[file_hash].append(filepath)
+        collisions = {h: paths for h, paths in self.hash_to_files.items() if len(paths) > 1}
+        if xxhash is not None:
+            # xxh3 is a bucketing hash, not a cryptographic one; confirm
+            # each colliding bucket with BLAKE2b so an accidental 128-bit
+            # collision cannot report distinct files as duplicates. Only
+            # bucket members are rehashed, so the confirm pass is cheap.
+            confirmed = defaultdict(list)
+            for paths in collisions.values():
+                for filepath in paths:
+                    try:
+                        with open(filepath, "rb", buffering=0) as f:
+                            strong = hashlib.file_digest(
+                                f, lambda: hashlib.blake2b(digest_size=32),
+                                _bufsize=1024 * 1024).hexdigest()
+                    except OSError:
+                        continue
+                    confirmed[strong].append(filepath)
+            collisions = {h: p for h, p in confirmed.items() if len(p) > 1}
+        return collisions
+
+    def analyze_file(self, filepath):
+        """Collect size plus language-specific structure for one file.
+
+        Results are memoized by (path, mtime_ns, size) so repeated scans
+        of an unchanged file skip the read and re-parse entirely; a
+        touched file naturally misses the cache and is re-analyzed.
+        """
+        try:
+            st = os.stat(filepath)
+        except OSError:
+            return {"path": filepath, "size": 0}
+        cache_key = (filepath, st.st_mtime_ns, st.st_size)
+        cached = self.analyzed_files.get(cache_key)
+        if cached is not None:
+            return cached
+        info = {
+            "path": filepath,
+            "size": st.st_size,
+        }
+        ext = os.path.splitext(filepath)[1]
+        if ext == ".json":
+            # The config analyzer reads (or streams) the file itself,
+            # so large lockfiles are never slurped into memory here.
+            info.update(self._analyze_config_file(filepath, st.st_size))
+        elif ext in (".py", ".js", ".ts"):
+            try:
+                with open(filepath, "r", encoding="utf-8", errors="ignore") as f:
+                    content = f.read()
+            except OSError:
+                return info
+            if ext == ".py":
+                info.update(self._analyze_python_file(content))
+            else:
+                info.update(self._analyze_js_file(content))
+        self.analyzed_files[cache_key] = info
+        return info
+
+    def _analyze_python_file(self, content):
+        """Extract imports and definitions with one C-level AST pass.
+
+        ast.parse walks the file in C instead of a Python loop of
+        startswith/split per line, and is immune to false positives from
+        indented or docstring lines. Files that do not parse fall back
+        to a single compiled-regex scan.
+        """
+        try:
+            tree = ast.parse(content)
+        except (SyntaxError, ValueError):
+            imports, definitions = [], []
+            for match in _PY_LINE_RE.finditer(content):
+                keyword = match.group(1)
+                if keyword in ("import", "from"):
+                    imports.append(match.group(0).strip())
+                else:
+                    definitions.append(f"{keyword} {match.group(2)}")
+            return {"imports": imports, "definitions": definitions}
+        imports = []
+        definitions = []
+        for node in ast.walk(tree):
+            if isinstance(node, (ast.Import, ast.ImportFrom)):
+                imports.append(ast.unparse(node))
+            elif isinstance(node, (ast.FunctionDef, ast.AsyncFunctionDef)):
+                definitions.append(f"def {node.name}")
+            elif isinstance(node, ast.ClassDef):
+                definitions.append(f"class {node.name}")
+        return {"imports": imports, "definitions": definitions}
+
+    def _analyze_js_file(self, content):
+        # Single pass: one splitlines() allocation and one strip per
+        # line, dispatching to both buckets, instead of splitting and
+        # walking the content once per bucket.
+        imports = []
+        exports = []
+        for line in content.splitlines():
+            stripped = line.strip()
+            if stripped.startswith("import ") or "require(" in stripped:
+                imports.append(stripped)
+            elif stripped.startswith("export ") or stripped.startswith("module.exports"):
+                exports.append(stripped)
+        return {"imports": imports, "exports": exports}
+
+    def _analyze_config_file(self, filepath, size):
+        """Extract dependency names from a JSON config.
+
+        Only the dependency keys are needed, so for large lockfiles the
+        parse streams via ijson (when importable) instead of slurping
+        the whole document into memory: O(1) memory rather than O(file).
+        """
+        if ijson is not None and size > _MMAP_THRESHOLD:
+            result = {}
+            for section in ("dependencies", "devDependencies"):
+                try:
+                    with open(filepath, "rb") as f:
+                        keys = [k for k, _ in ijson.kvitems(f, section)]
+                except (OSError, ijson.JSONError):
+                    continue
+                if keys:
+                    result[section] = keys
+            return result
+        try:
+            with open(filepath, "r", encoding="utf-8", errors="ignore") as f:
+                data = json.load(f)
+        except (OSError, ValueError):
+            return {}
+        result = {}
+        if isinstance(data, dict):
+            if "dependencies" in data and isinstance(data["dependencies"], dict):
+                result["dependencies"] = list(data["dependencies"].keys())
+            if "devDependencies" in data and isinstance(data["devDependencies"], dict):
+                result["devDependencies"] = list(data["devDependencies"].keys())
+        return result
+
+    def analyze_dependencies(self, directory="."):
+        """Aggregate declared dependencies across all config files."""
+        dependencies = defaultdict(list)
+        for filepath, entry in self._iter_files(directory):
+            if entry.name in ("package.json", "package-lock.json", "requirements.txt"):
+                info = self.analyze_file(filepath)
+                for dep in info.get("dependencies", []):
+                    dependencies[dep].append(filepath)
+        return dict(dependencies)
+
+    def identify_merge_candidates(self, directory=".", files=None):
+        """Find module pairs that look like renamed/suffixed copies."""
+        python_modules = defaultdict(list)
+        for filepath, name, _ in (files if files is not None else self.scan_tree(directory)):
+            if name.endswith(".py") or name.endswith(".ts") or name.endswith(".js"):
+                python_modules[os.path.splitext(name)[0]].append(filepath)
+
+        # Instead of running every (name, other) pair through a
+        # similarity check (O(N^2) with several substring scans each),
+        # strip the known affixes from each name and probe the module
+        # index directly: O(N * affixes) dict lookups total.
+        candidates = []
+        seen = set()
+        for module_name in python_modules:
+            for base in self._module_bases(module_name):
+                if base not in python_modules:
+                    continue
+                pair = tuple(sorted((module_name, base)))
+                if pair in seen:
+                    continue
+                seen.add(pair)
+                candidates.append({
+                    "modules": list(pair),
+                    "paths": python_modules[pair[0]] + python_modules[pair[1]],
+                    "confidence": self._calculate_merge_confidence(
+                        python_modules[pair[0]], python_modules[pair[1]]),
+                })
+        return candidates
+
+    def _module_bases(self, name):
+        """Base names this module would collide with once affixes are stripped."""
+        bases = []
+        for affix in ("test", "demo", "example", "util", "helper"):
+            prefix = affix + "_"
+            suffix = "_" + affix
+            if name.startswith(prefix) and len(name) > len(prefix):
+                bases.append(name[len(prefix):])
+            if name.endswith(suffix) and len(name) > len(suffix):
+                bases.append(name[:-len(suffix)])
+        return bases
+
+    def _calculate_duplicate_confidence(self, original, duplicates):
+        """Score how likely each duplicate is an intentional copy of original."""
+        original_parts = original.replace("\\", "/").split("/")
+        # Build the original's part set once; C-level set intersection
+        # replaces the per-part membership loop (which rebuilt the set
+        # for every part of every duplicate).
+        orig_set = set(original_parts)
+        orig_len = len(original_parts)
+        scores = []
+        for dup in duplicates:
+            dup_parts = dup.replace("\\", "/").split("/")
+            common = len(orig_set.intersection(dup_parts))
+            scores.append(common / max(orig_len, len(dup_parts)))
+        return scores
+
+    def _calculate_merge_confidence(self, paths_a, paths_b):
+        sizes_a = [os.path.getsize(p) for p in paths_a if os.path.exists(p)]
+        sizes_b = [os.path.getsize(p) for p in paths_b if os.path.exists(p)]
+        if not sizes_a or not sizes_b:
+            return 0.0
+        ratio = min(sum(sizes_a), sum(sizes_b)) / max(sum(sizes_a), sum(sizes_b))
+        return round(ratio, 3)
+
+    def _merge_module_files(self, primary, duplicates):
+        """Merge import/definition surface of duplicates into primary.
+
+        Lines are streamed straight off the file object, so neither the
+        full content string nor a list of all lines is ever
+        materialized — only the import/definition lines we keep.
+        """
+        imports = set()
+        functions = []
+        with open(primary, "r", encoding="utf-8", errors="ignore") as f:
+            for line in f:
+                stripped = line.strip()
+                if stripped.startswith(("import ", "from ")):
+                    imports.add(stripped)
+                elif stripped.startswith(("def ", "class ")):
+                    functions.append(stripped)
+        for dup in duplicates:
+            with open(dup, "r", encoding="utf-8", errors="ignore") as f:
+                for line in f:
+                    stripped = line.strip()
+                    if stripped.startswith(("import ", "from ")):
+                        imports.add(stripped)
+        return {"primary": primary, "imports": sorted(imports), "definitions": functions}
+
+    def _iter_json_items(self, filepath):
+        """Yield top-level (key, value) pairs from a JSON object file.
+
+        Files past the mmap threshold stream through ijson (when
+        importable), so only one top-level value is materialized at a
+        time instead of the whole document.
+        """
+        if ijson is not None and os.path.getsize(filepath) > _MMAP_THRESHOLD:
+            with open(filepath, "rb") as f:
+                yield from ijson.kvitems(f, "")
+            return
+        with open(filepath, "r", encoding="utf-8") as f:
+            yield from json.load(f).items()
+
+    def _merge_json_configs(self, primary, duplicates):
+        merged = dict(self._iter_json_items(primary))
+        for dup in duplicates:
+            for key, value in self._iter_json_items(dup):
+                if key not in merged:
+                    merged[key] = value
+        return merged
+
+    def merge_files(self, candidates, directory="."):
+        """Produce merge plans for each candidate set (no writes)."""
+        plans = []
+        for candidate in candidates:
+            paths = [p for p in candidate["paths"] if os.path.exists(p)]
+            if len(paths) < 2:
+                continue
+            primary = max(paths, key=os.path.getsize)
+            duplicates = [p for p in paths if p != primary]
+            if primary.endswith(".json"):
+                plans.append({"merged": self._merge_json_configs(primary, duplicates),
+                              "primary": primary, "duplicates": duplicates})
+            else:
+                plans.append(self._merge_module_files(primary, duplicates))
+        return plans
+
+    def _calculate_savings(self, duplicates):
+        """Bytes reclaimable if all duplicate copies were removed."""
+        savings = 0
+        for file_hash, paths in duplicates.items():
+            sizes = [os.path.getsize(p) for p in paths if os.path.exists(p)]
+            if sizes:
+                savings += sum(sizes) - max(sizes)
+        return savings
+
+
+class SelfHealer:
+    """Backs up files before risky operations so they can be restored."""
+
+    def __init__(self, backup_dir="state/backups"):
+        self.backup_dir = backup_dir
+
+    def create_backup(self, path):
+        os.makedirs(self.backup_dir, exist_ok=True)
+        stamp = datetime.now().strftime("%Y%m%d_%H%M%S")
+        dest = os.path.join(self.backup_dir, f"{os.path.basename(path)}.{stamp}")
+        if os.path.isdir(path):
+            shutil.copytree(path, dest, copy_function=self._copy_file)
+        else:
+            self._copy_file(path, dest)
+        return dest
+
+    @staticmethod
+    def _copy_file(src, dest):
+        """Copy src to dest without a user-space bounce buffer.
+
+        os.copy_file_range copies inside the kernel and lets CoW
+        filesystems (Btrfs, XFS, ZFS) satisfy it as a metadata-only
+        reflink, so backing up before a risky op costs no data I/O
+        there. Falls back to shutil.copy2 where the syscall is missing
+        or the mount refuses it (EXDEV/ENOTSUP).
+        """
+        if not hasattr(os, "copy_file_range"):
+            return shutil.copy2(src, dest)
+        try:
+            with open(src, "rb") as fsrc, open(dest, "wb") as fdst:
+                remaining = os.fstat(fsrc.fileno()).st_size
+                while remaining > 0:
+                    copied = os.copy_file_range(fsrc.fileno(), fdst.fileno(), remaining)
+                    if copied == 0:
+                        break
+                    remaining -= copied
+            shutil.copystat(src, dest)
+            return dest
+        except OSError:
+            return shutil.copy2(src, dest)
+
+
+def analyze_duplicates(root_dir="."):
+    """Full duplicate analysis; writes state/duplicate_analysis.json."""
+    dedup = FileDeduplicator(root_dir)
+
+    # One shared traversal feeds the count and both analysis passes;
+    # previously each did its own full walk (three stats per file).
+    files = dedup.scan_tree(root_dir)
+    total_files = len(files)
+
+    duplicates = dedup.find_duplicates(root_dir, files=files)
+    candidates = dedup.identify_merge_candidates(root_dir, files=files)
+
+    duplicate_files = []
+    for file_hash, paths in duplicates.items():
+        original = min(paths, key=len)
+        others = [p for p in paths if p != original]
+        confidences = dedup._calculate_duplicate_confidence(original, others)
+        for dup, confidence in zip(others, confidences):
+            duplicate_files.append(DuplicateFile(
+                path=dup, original=original, hash=file_hash,
+                size=os.path.getsize(dup) if os.path.exists(dup) else 0,
+                confidence=confidence))
+
+    report = {
+        "timestamp": datetime.now().isoformat(),
+        "hash_algorithm": _identity_algorithm(),
+        "total_files": total_files,
+        "duplicate_sets": len(duplicates),
+        "duplicates": [asdict(d) for d in duplicate_files],
+        "merge_candidates": candidates,
+        "potential_savings_bytes": dedup._calculate_savings(duplicates),
+    }
+    os.makedirs("state", exist_ok=True)
+    with open("state/duplicate_analysis.json", "w") as f:
+        json.dump(report, f, indent=2)
+    return report
+
+
+def remove_duplicates(root_dir=".", dry_run=True):
+    """Remove duplicate copies recorded by analyze_duplicates.
+
+    The persisted analysis is the source of truth: re-hashing the whole
+    tree here would repeat the work analyze_duplicates just did. The
+    report is regenerated only if absent, and each recorded duplicate is
+    re-verified against its stored hash — with the same algorithm the
+    report records — before deletion in case the file changed since the
+    analysis ran.
+    """
+    try:
+        with open("state/duplicate_analysis.json") as f:
+            report = json.load(f)
+    except (OSError, ValueError):
+        report = analyze_duplicates(root_dir)
+
+    dedup = FileDeduplicator(root_dir)
+    healer = SelfHealer()
+    hasher = _identity_hasher(report.get("hash_algorithm", _identity_algorithm()))
+    removed = []
+    for dup in report.get("duplicates", []):
+        path = dup["path"]
+        if not os.path.exists(path) or not os.path.exists(dup["original"]):
+            continue
+        try:
+            if dedup.calculate_file_hash(path, hasher=hasher) != dup["hash"]:
+                continue
+        except OSError:
+            continue
+        if not dry_run:
+            healer.create_backup(path)
+            os.remove(path)
+        removed.append(path)
+    return removed
+
+
+@app.command()
+def analyze(root_dir: str = "."):
+    report = analyze_duplicates(root_dir)
+    print(f"Scanned {report['total_files']} files: "
+          f"{report['duplicate_sets']} duplicate sets, "
+          f"{report['potential_savings_bytes']} bytes reclaimable.")
+
+
+@app.command()
+def remove(root_dir: str = ".", dry_run: bool = True):
+    removed = remove_duplicates(root_dir, dry_run=dry_run)
+    action = "Would remove" if dry_run else "Removed"
+    print(f"{action} {len(removed)} duplicate files.")
+
+
+if __name__ == "__main__":
+    app()
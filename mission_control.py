@@ -0,0 +1,553 @@
+"""Mission control center for the CTR consolidation stack.
+
+Supervises the consolidation agent and the proof/DLT layer, runs
+health checks, and renders a terminal dashboard of active missions.
+Configuration lives in config/mission_control.yaml; state and logs land
+under state/ and logs/ like the rest of the agent scripts.
+"""
+
+import asyncio
+import atexit
+import collections
+import functools
+import logging
+import logging.handlers
+import os
+import queue
+import signal
+import time
+from dataclasses import dataclass, replace
+from datetime import datetime
+from pathlib import Path
+from typing import Any, Dict, List, Optional, Protocol, runtime_checkable
+
+import typer
+
+from consolidation_agent import ConsolidationAgent
+from proof_engine import DLTOperations
+
+logger = logging.getLogger("mission_control")
+
+DEFAULT_CONFIG = {
+    "dashboard_refresh_rate": 2.0,
+    "health_check_interval": 5.0,
+    "shutdown_timeout": 30.0,
+    "max_health_history": 100,
+    "max_mission_history": 200,
+}
+
+REQUIRED_DIRS = ["state", "logs", "config", "backups"]
+
+# Parsed configuration keyed by (path, st_mtime_ns): controllers built
+# repeatedly (test harnesses, CLI one-shots) reuse the parse instead of
+# re-reading the YAML per instance. A changed file changes the key.
+_CONFIG_CACHE: Dict[tuple, Dict[str, Any]] = {}
+
+
+def ensure_directories(directories) -> None:
+    """Create any missing directories with one listing pass.
+
+    Path.mkdir(exist_ok=True) per directory costs a stat plus a mkdir
+    each launch; one scandir learns what already exists and only the
+    truly missing ones are created.
+    """
+    try:
+        existing = {entry.name for entry in os.scandir(".") if entry.is_dir()}
+    except OSError:
+        existing = set()
+    for directory in directories:
+        if directory not in existing:
+            try:
+                os.mkdir(directory)
+            except FileExistsError:
+                pass
+
+
+def _setup_logging() -> None:
+    """Route all logging through a queue so emitters never touch disk.
+
+    Coroutines log from the event loop thread; a QueueHandler makes
+    that a lock-free enqueue, while a background QueueListener owns the
+    file and stream handlers and does the blocking write()/flush().
+    """
+    os.makedirs("logs", exist_ok=True)
+    log_queue: "queue.SimpleQueue" = queue.SimpleQueue()
+    formatter = logging.Formatter("%(asctime)s %(name)s %(levelname)s %(message)s")
+    file_handler = logging.FileHandler("logs/mission_control.log")
+    stream_handler = logging.StreamHandler()
+    for handler in (file_handler, stream_handler):
+        handler.setFormatter(formatter)
+    root = logging.getLogger()
+    root.setLevel(logging.INFO)
+    root.addHandler(logging.handlers.QueueHandler(log_queue))
+    listener = logging.handlers.QueueListener(
+        log_queue, file_handler, stream_handler, respect_handler_level=True
+    )
+    listener.start()
+    atexit.register(listener.stop)
+
+
+@runtime_checkable
+class Shutdownable(Protocol):
+    """Agents that can be stopped cleanly by mission control."""
+
+    async def shutdown(self) -> None: ...
+
+
+@functools.lru_cache(maxsize=None)
+def _is_shutdownable(cls: type) -> bool:
+    """Structural check memoized per class, not per shutdown call."""
+    return issubclass(cls, Shutdownable)
+
+
+@dataclass(slots=True, frozen=True)
+class SystemStatus:
+    """Snapshot of the control center for one dashboard tick.
+
+    Frozen and slotted: snapshots are immutable values produced every
+    publish interval, so dropping the per-instance __dict__ saves
+    memory and makes field access a fixed-offset load.
+    """
+
+    status: str
+    uptime: str
+    started_at: str
+    active_missions: int
+    agents_online: int
+    agents_total: int
+    healthy: bool
+
+
+class MissionControlDashboard:
+    """Renders system status to the terminal."""
+
+    __slots__ = (
+        "center",
+        "_header",
+        "_footer",
+        "_field_prefixes",
+        "_render",
+        "_last_values",
+    )
+
+    FIELD_LABELS = (
+        "Status",
+        "Started",
+        "Uptime",
+        "Active missions",
+        "Agents online",
+        "Healthy",
+    )
+
+    def __init__(self, center: "MissionControlCenter"):
+        self.center = center
+        # The frame layout never changes: build the banner and the
+        # label column once, so each repaint only joins fresh values
+        # onto cached static strings.
+        bar = "=" * 60
+        self._header = bar + "\n  CTR MISSION CONTROL\n" + bar
+        self._footer = bar
+        width = max(len(label) for label in self.FIELD_LABELS) + 2
+        self._field_prefixes = tuple(
+            f"  {label}:".ljust(width + 3) for label in self.FIELD_LABELS
+        )
+        self._render = self._compile_renderer()
+        self._last_values: Optional[tuple] = None
+
+    def _compile_renderer(self):
+        """Compile the frame template into a positional render function.
+
+        The static layout is baked into one f-string literal at
+        construction, so each repaint is a single call taking the six
+        field values — CPython formats straight from locals instead of
+        re-walking attribute lookups and template pieces per frame.
+        """
+        parts = [self._header]
+        for i, prefix in enumerate(self._field_prefixes):
+            parts.append("\n" + prefix + "{v%d}" % i)
+        parts.append("\n" + self._footer)
+        template = "".join(parts)
+        args = ", ".join(f"v{i}" for i in range(len(self._field_prefixes)))
+        source = f"def _render({args}):\n    return f{template!r}"
+        namespace: Dict[str, Any] = {}
+        exec(compile(source, "<dashboard-template>", "exec"), namespace)
+        return namespace["_render"]
+
+    def _field_values(self, status: SystemStatus) -> tuple:
+        return (
+            status.status,
+            status.started_at,
+            status.uptime,
+            str(status.active_missions),
+            f"{status.agents_online}/{status.agents_total}",
+            "yes" if status.healthy else "NO",
+        )
+
+    # Header occupies rows 1-3; field i renders on row 4+i, after its
+    # label prefix. Row 11 is the first line below the frame.
+    _FIRST_FIELD_ROW = 4
+    _BELOW_FRAME_ROW = 11
+
+    def display_status(self, status: SystemStatus) -> str:
+        """Repaint the dashboard, rewriting only what changed.
+
+        The first frame clears the screen and draws everything; later
+        frames cursor-address just the fields whose values differ from
+        the previous tick, then park below the frame and clear the
+        mission area. On a quiet system this writes a few dozen bytes
+        per repaint instead of the whole screen.
+        """
+        values = self._field_values(status)
+        frame = self._render(*values)
+        if self._last_values is None:
+            print(f"\033[2J\033[H{frame}\033[{self._BELOW_FRAME_ROW};1H\033[J", end="")
+        else:
+            updates = []
+            for i, (old, new) in enumerate(zip(self._last_values, values)):
+                if old != new:
+                    row = self._FIRST_FIELD_ROW + i
+                    col = len(self._field_prefixes[i]) + 1
+                    pad = " " * max(len(old) - len(new), 0)
+                    updates.append(f"\033[{row};{col}H{new}{pad}")
+            updates.append(f"\033[{self._BELOW_FRAME_ROW};1H\033[J")
+            print("".join(updates), end="")
+        self._last_values = values
+        return frame
+
+    async def run_dashboard(self) -> None:
+        """Redraw whenever the status publisher flags a change.
+
+        The dashboard no longer re-runs health checks itself; it sleeps
+        on the dirty event and repaints only when the background
+        publisher or a mission transition marks the status changed.
+        """
+        refresh = self.center.config["dashboard_refresh_rate"]
+        while not self.center.shutdown_requested:
+            try:
+                await asyncio.wait_for(self.center.status_changed.wait(), timeout=refresh)
+            except asyncio.TimeoutError:
+                # Nothing flagged a change, but uptime still ticks;
+                # fall through to the same repaint so the clock keeps
+                # advancing and the mission lines (cleared by every
+                # frame's below-frame erase) are reprinted.
+                pass
+            else:
+                self.center.status_changed.clear()
+            status = self.center.latest_status
+            if status is None:
+                continue
+            # The published status carries the uptime as of the last
+            # health tick; refresh it so repaints never show a clock
+            # older than the previous frame's.
+            self.display_status(
+                replace(status, uptime=self.center._format_uptime()))
+            for mission_id, mission_info in await self.center.mission_snapshot():
+                print(f"  {mission_id}: {mission_info.get('status', '?')}")
+
+
+class MissionControlCenter:
+    """Owns the agent fleet, health history, and mission bookkeeping."""
+
+    __slots__ = (
+        "root_dir",
+        "config",
+        "agents",
+        "active_missions",
+        "health_checks",
+        "start_time",
+        "_start_mono",
+        "_started_at_str",
+        "_uptime_cache",
+        "shutdown_event",
+        "dashboard",
+        "latest_status",
+        "status_changed",
+        "_missions_lock",
+    )
+
+    def __init__(self, root_dir: str = "."):
+        self.root_dir = root_dir
+        self.config = self._load_configuration()
+        self.agents: Dict[str, Any] = {}
+        # Insertion-ordered and bounded: once the table exceeds
+        # max_mission_history, the oldest completed/failed entries are
+        # evicted so long-running sessions keep constant memory and
+        # dashboard ticks iterate a capped working set.
+        self.active_missions: "collections.OrderedDict[str, Dict[str, Any]]" = (
+            collections.OrderedDict()
+        )
+        # Bounded ring of recent health results; deque(maxlen) evicts in
+        # O(1) instead of re-slicing a list each tick.
+        self.health_checks: "collections.deque[Dict[str, Any]]" = collections.deque(
+            maxlen=self.config["max_health_history"]
+        )
+        self.start_time = datetime.now()
+        # Monotonic base for uptime: immune to wall-clock steps and much
+        # cheaper than datetime arithmetic per tick. The formatted
+        # string is cached on its integer-second value.
+        self._start_mono = time.monotonic()
+        self._started_at_str = self.start_time.strftime("%Y-%m-%d %H:%M:%S")
+        self._uptime_cache = (-1, "")
+        self.shutdown_event = asyncio.Event()
+        self.dashboard = MissionControlDashboard(self)
+        # Latest published snapshot plus the event the dashboard sleeps
+        # on; set whenever the observable status actually changes.
+        self.latest_status: Optional[SystemStatus] = None
+        self.status_changed = asyncio.Event()
+        # Writers mutate active_missions under this lock; readers take
+        # an immutable snapshot so dashboard iteration can never race a
+        # concurrent insert or eviction.
+        self._missions_lock = asyncio.Lock()
+
+    def _load_configuration(self) -> Dict[str, Any]:
+        """Read config/mission_control.yaml, falling back to defaults."""
+        config = dict(DEFAULT_CONFIG)
+        config_path = Path("config/mission_control.yaml")
+        try:
+            mtime_ns = config_path.stat().st_mtime_ns
+        except OSError:
+            return config
+        key = (str(config_path), mtime_ns)
+        loaded = _CONFIG_CACHE.get(key)
+        if loaded is None:
+            try:
+                import yaml
+
+                loaded = yaml.safe_load(config_path.read_text()) or {}
+            except ImportError:
+                logger.warning("pyyaml not installed; using default configuration")
+                loaded = {}
+            _CONFIG_CACHE[key] = loaded
+        config.update(loaded)
+        return config
+
+    @property
+    def shutdown_requested(self) -> bool:
+        return self.shutdown_event.is_set()
+
+    def install_signal_handlers(self) -> None:
+        """Register shutdown signals on the running event loop.
+
+        loop.add_signal_handler runs the callback on the loop itself,
+        so setting the asyncio.Event is race-free; plain signal.signal
+        remains as the fallback where the loop API is unavailable.
+        """
+        loop = asyncio.get_running_loop()
+        for sig in (signal.SIGINT, signal.SIGTERM):
+            try:
+                loop.add_signal_handler(sig, self._request_shutdown)
+            except (NotImplementedError, RuntimeError):
+                signal.signal(sig, lambda signum, frame: self._request_shutdown())
+
+    def _request_shutdown(self) -> None:
+        logger.info("shutdown requested")
+        self.shutdown_event.set()
+        # Wake the dashboard immediately instead of at its next timeout.
+        self.status_changed.set()
+
+    async def initialize_system(self) -> None:
+        """Create required directories and bring all agents online."""
+        ensure_directories(REQUIRED_DIRS)
+        consolidation = ConsolidationAgent(self.root_dir)
+        dlt = DLTOperations()
+        self.agents = {"consolidation": consolidation, "dlt": dlt}
+        # Agents have no init-order dependency: start every bootstrap
+        # together and let their I/O waits overlap on the loop.
+        inits = [
+            agent.initialize()
+            for agent in self.agents.values()
+            if hasattr(agent, "initialize")
+        ]
+        results = await asyncio.gather(*inits, return_exceptions=True)
+        for result in results:
+            if isinstance(result, Exception):
+                logger.error("agent initialization failed: %s", result)
+        logger.info("system initialized with %d agents", len(self.agents))
+
+    async def health_check(self) -> Dict[str, Any]:
+        """Probe each agent and the state directory."""
+        agent_health = {}
+        for name, agent in self.agents.items():
+            agent_health[name] = agent is not None
+        result = {
+            "agents": agent_health,
+            "state_dir": os.path.isdir("state"),
+            "healthy": all(agent_health.values()) and os.path.isdir("state"),
+        }
+        self.record_health_check(result)
+        return result
+
+    def record_health_check(self, result: Dict[str, Any]) -> None:
+        """Append one health result to the bounded history.
+
+        Timestamps stay as raw time.time() floats; ISO formatting is
+        render-time work, not per-tick work.
+        """
+        entry = dict(result)
+        entry["timestamp"] = time.time()
+        self.health_checks.append(entry)
+
+    def _format_uptime(self) -> str:
+        uptime_s = int(time.monotonic() - self._start_mono)
+        cached_s, cached_str = self._uptime_cache
+        if uptime_s != cached_s:
+            hours, rem = divmod(uptime_s, 3600)
+            minutes, seconds = divmod(rem, 60)
+            cached_str = f"{hours}:{minutes:02d}:{seconds:02d}"
+            self._uptime_cache = (uptime_s, cached_str)
+        return cached_str
+
+    async def get_system_status(self) -> SystemStatus:
+        """Assemble the dashboard snapshot for this tick."""
+        health = await self.health_check()
+        return SystemStatus(
+            status="shutting down" if self.shutdown_requested else "running",
+            uptime=self._format_uptime(),
+            started_at=self._started_at_str,
+            active_missions=len(
+                [m for m in self.active_missions.values() if m.get("status") == "active"]
+            ),
+            agents_online=sum(1 for a in self.agents.values() if a is not None),
+            agents_total=len(self.agents),
+            healthy=health["healthy"],
+        )
+
+    def _status_signature(self, status: SystemStatus) -> tuple:
+        """The fields whose change warrants a repaint (uptime excluded)."""
+        return (
+            status.status,
+            status.active_missions,
+            status.agents_online,
+            status.healthy,
+        )
+
+    async def publish_status(self) -> None:
+        """Background task: run health checks, publish on change."""
+        interval = self.config["health_check_interval"]
+        while not self.shutdown_event.is_set():
+            status = await self.get_system_status()
+            changed = self.latest_status is None or self._status_signature(
+                status
+            ) != self._status_signature(self.latest_status)
+            self.latest_status = status
+            if changed:
+                self.status_changed.set()
+            try:
+                # Sleeps for the interval but wakes instantly on shutdown.
+                await asyncio.wait_for(self.shutdown_event.wait(), timeout=interval)
+            except asyncio.TimeoutError:
+                pass
+
+    async def start_mission(self, objective: str) -> str:
+        """Plan and launch a consolidation mission."""
+        consolidation: ConsolidationAgent = self.agents["consolidation"]
+        # Planning is synchronous and can scan the whole tree when no
+        # duplicate analysis exists yet; run it on the default thread
+        # pool so the dashboard and publisher keep ticking meanwhile.
+        mission_id = await asyncio.to_thread(consolidation.plan_consolidation_mission)
+        async with self._missions_lock:
+            self.active_missions[mission_id] = {
+                "objective": objective,
+                "status": "active",
+                "started_at": datetime.now().isoformat(),
+            }
+            self._prune_missions()
+        asyncio.ensure_future(self._run_mission(mission_id))
+        return mission_id
+
+    async def mission_snapshot(self) -> tuple:
+        """Immutable view of the mission table for readers."""
+        async with self._missions_lock:
+            return tuple(self.active_missions.items())
+
+    def _prune_missions(self) -> None:
+        """Evict the oldest terminal missions beyond the history cap."""
+        cap = self.config["max_mission_history"]
+        if len(self.active_missions) <= cap:
+            return
+        for mission_id in list(self.active_missions):
+            if len(self.active_missions) <= cap:
+                break
+            if self.active_missions[mission_id].get("status") in ("completed", "failed"):
+                del self.active_missions[mission_id]
+
+    async def _run_mission(self, mission_id: str) -> None:
+        consolidation: ConsolidationAgent = self.agents["consolidation"]
+        succeeded = await consolidation.execute_mission(mission_id)
+        async with self._missions_lock:
+            info = self.active_missions.get(mission_id)
+            if info is not None:
+                info["status"] = "completed" if succeeded else "failed"
+                info["finished_at"] = datetime.now().isoformat()
+        self.status_changed.set()
+
+    async def _shutdown_agent(self, name: str, agent: Any) -> None:
+        logger.info("shutting down agent %s", name)
+        if _is_shutdownable(type(agent)):
+            await agent.shutdown()
+        else:
+            logger.debug("agent %s has no shutdown(), skipping", name)
+
+    async def emergency_shutdown(self) -> None:
+        """Stop all agents, each bounded by its own timeout.
+
+        A single global deadline lets one stuck agent burn the whole
+        budget and starve the rest; wrapping each shutdown in its own
+        wait_for cancels stragglers individually, so total time is the
+        slowest agent, capped per agent.
+        """
+        self.shutdown_event.set()
+        per_agent = self.config["shutdown_timeout"] / max(len(self.agents), 1)
+        tasks = [
+            asyncio.wait_for(self._shutdown_agent(name, agent), timeout=per_agent)
+            for name, agent in self.agents.items()
+        ]
+        results = await asyncio.gather(*tasks, return_exceptions=True)
+        for name, result in zip(self.agents, results):
+            if isinstance(result, asyncio.TimeoutError):
+                logger.error("agent %s shutdown timed out after %.1fs", name, per_agent)
+            elif isinstance(result, Exception):
+                logger.error("agent %s shutdown failed: %s", name, result)
+
+    async def run(self) -> None:
+        """Full lifecycle: init, dashboard loop, shutdown."""
+        self.install_signal_handlers()
+        await self.initialize_system()
+        try:
+            # Supervised together: if either the dashboard or the
+            # status publisher dies, the TaskGroup cancels its sibling
+            # and re-raises instead of leaving a half-running system.
+            async with asyncio.TaskGroup() as group:
+                group.create_task(self.dashboard.run_dashboard())
+                group.create_task(self.publish_status())
+        finally:
+            await self.emergency_shutdown()
+
+
+app = typer.Typer()
+
+
+@app.command()
+def run():
+    """Start mission control with the live dashboard."""
+    _setup_logging()
+    asyncio.run(MissionControlCenter().run())
+
+
+@app.command()
+def status():
+    """Print one system status snapshot and exit."""
+    _setup_logging()
+
+    async def _once():
+        center = MissionControlCenter()
+        await center.initialize_system()
+        status = await center.get_system_status()
+        center.dashboard.display_status(status)
+        await center.emergency_shutdown()
+
+    asyncio.run(_once())
+
+
+if __name__ == "__main__":
+    app()
@@ -0,0 +1,583 @@
+"""Proof engine and blockchain manifest for CTR consolidation runs.
+
+Records consolidation operations as hash-chained transactions, anchors them
+under a Merkle root, and emits verifiable before/after proofs for the file
+consolidation work driven by consolidation_agent. State is written under
+state/ alongside the other agent artifacts.
+"""
+
+import asyncio
+import collections
+import hashlib
+import json
+import mmap
+import os
+import time
+from dataclasses import asdict, dataclass, field
+from datetime import datetime
+from pathlib import Path
+from typing import Any, Dict, List, Optional
+
+import typer
+
+from file_deduplicator import advise_readahead
+
+try:
+    import orjson
+except ImportError:  # optional accelerator
+    orjson = None
+
+GENESIS_HASH = "0" * 64
+
+
+def _iso(timestamp_ns: int) -> str:
+    """Format a time.time_ns() timestamp as ISO-8601, for serialization."""
+    return datetime.fromtimestamp(timestamp_ns / 1e9).isoformat()
+
+
+def _dump_pretty(data: Dict[str, Any]) -> bytes:
+    """Indented JSON bytes for state files, newline-terminated."""
+    if orjson is not None:
+        return orjson.dumps(
+            data, option=orjson.OPT_INDENT_2 | orjson.OPT_APPEND_NEWLINE
+        )
+    return (json.dumps(data, indent=2) + "\n").encode()
+
+
+def _canonical(data: Dict[str, Any]) -> bytes:
+    """Canonical (key-sorted) JSON bytes for hashing a payload once."""
+    if orjson is not None:
+        return orjson.dumps(data, option=orjson.OPT_SORT_KEYS)
+    return json.dumps(data, sort_keys=True).encode()
+
+# Files at or above this size are hashed via mmap instead of buffered
+# reads — zero-copy from the page cache into the hasher.
+_MMAP_THRESHOLD = 1024 * 1024
+_HAS_FADVISE = hasattr(os, "posix_fadvise")
+
+# Cap on concurrently hashed files per proof batch.
+_IO_CONCURRENCY = min(32, (os.cpu_count() or 4) * 4)
+
+# Fixed initial SHA-256 state, built once at import. Merkle combines copy
+# this instead of re-running the constructor per pair — the portable
+# analogue of hardcoding the fixed part of the per-hash setup.
+_SHA256_INIT = hashlib.sha256()
+
+
+def _copy_hash_pair(pair: bytes, _copy=_SHA256_INIT.copy) -> bytes:
+    """64-byte combine via a clone of the preinitialized hasher state."""
+    h = _copy()
+    h.update(pair)
+    return h.digest()
+
+
+def _ctor_hash_pair(pair: bytes, _sha256=hashlib.sha256) -> bytes:
+    """64-byte combine via a direct constructor call."""
+    return _sha256(pair).digest()
+
+
+def _pick_hash_pair():
+    """Choose the faster 64-byte combine kernel once at import.
+
+    hashlib already routes to whatever SHA-256 implementation OpenSSL
+    selected for this CPU (SHA-NI, AVX2, scalar), so the remaining
+    choice is how the Python-side call is shaped. A short timing run
+    resolves it here; every Merkle combine afterwards is a direct call
+    with no per-hash dispatch.
+    """
+    pair = b"\x00" * 64
+    best, best_time = None, None
+    for candidate in (_copy_hash_pair, _ctor_hash_pair):
+        start = time.perf_counter()
+        for _ in range(2000):
+            candidate(pair)
+        elapsed = time.perf_counter() - start
+        if best_time is None or elapsed < best_time:
+            best, best_time = candidate, elapsed
+    return best
+
+
+_hash_pair = _pick_hash_pair()
+
+
+def _hash_file(filepath: str) -> bytes:
+    """Streaming SHA-256 of one file; missing files hash as empty.
+
+    Runs in worker threads — hashlib releases the GIL for large
+    updates, so reads and hashing overlap across files.
+    """
+    h = hashlib.sha256()
+    try:
+        with open(filepath, "rb") as f:
+            size = os.fstat(f.fileno()).st_size
+            if size >= _MMAP_THRESHOLD:
+                if _HAS_FADVISE:
+                    os.posix_fadvise(f.fileno(), 0, 0, os.POSIX_FADV_SEQUENTIAL)
+                with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mm:
+                    h.update(memoryview(mm))
+                if _HAS_FADVISE:
+                    os.posix_fadvise(f.fileno(), 0, 0, os.POSIX_FADV_DONTNEED)
+            else:
+                while chunk := f.read(1 << 20):
+                    h.update(chunk)
+    except (OSError, ValueError):
+        pass
+    return h.digest()
+
+
+@dataclass(slots=True)
+class BlockchainTransaction:
+    """A single hash-chained record of a consolidation operation."""
+
+    tx_id: str
+    operation: str
+    data: Dict[str, Any]
+    data_hash: str
+    previous_hash: str
+    merkle_root: str
+    # time.time_ns() at creation; ISO formatting happens only when a
+    # record is serialized.
+    timestamp: int
+
+
+@dataclass(slots=True)
+class ConsolidationProof:
+    """Before/after content hashes for one consolidation operation."""
+
+    proof_id: str
+    operation: str
+    files: List[str]
+    before_hash: str
+    after_hash: str = ""
+    status: str = "pending"
+    timestamp: int = 0
+
+
+class BlockchainOrchestrator:
+    """Maintains the transaction chain and its Merkle commitments."""
+
+    def __init__(self):
+        self.chain: List[BlockchainTransaction] = []
+        # Incremental Merkle state: roots of the perfect subtrees that
+        # cover the leaves appended so far (descending depth), plus the
+        # item list they were built from. Appending a leaf merges equal
+        # depths — amortized O(1) hashes per insert — and the root folds
+        # the frontier in O(log N).
+        self._merkle_forest: List[tuple] = []
+        self._merkle_items: List[str] = []
+        self._leaf_digests: Dict[str, bytes] = {}
+        # Transactions past this index have been appended but not yet
+        # hashed; resolve() fills their hash fields in when a reader
+        # actually needs them.
+        self._resolved = 0
+        # Per-operation counts maintained on insert so manifest refresh
+        # never rescans the chain.
+        self.op_counts: collections.Counter = collections.Counter()
+        # Struct-of-arrays columns: raw 32-byte link hashes for the
+        # resolved prefix of the chain, kept contiguous so verification
+        # sweeps run over two flat buffers instead of chasing dataclass
+        # instances.
+        self._data_hash_col = bytearray()
+        self._prev_hash_col = bytearray()
+
+    def calculate_digest(self, data: str) -> bytes:
+        """SHA-256 raw 32-byte digest of a string payload.
+
+        Internal callers work on raw digests; hex is produced only at
+        API boundaries, halving the bytes carried through hot paths.
+        """
+        return hashlib.sha256(data.encode()).digest()
+
+    def calculate_hash(self, data: str) -> str:
+        """SHA-256 hex digest of a string payload."""
+        return self.calculate_digest(data).hex()
+
+    @staticmethod
+    def _hash_pairs(pairs: List[bytes]) -> List[bytes]:
+        """Hash one whole Merkle level in a single batched call.
+
+        All sibling pairs for a level come in together so the per-level
+        work sits behind one seam; a multi-buffer SHA-256 kernel can be
+        dropped in here without touching the tree-walk logic. Each pair
+        is two raw 32-byte digests, so every combine hashes exactly one
+        64-byte SHA-256 block. The portable implementation runs the
+        kernel selected at import.
+        """
+        _combine = _hash_pair
+        return [_combine(pair) for pair in pairs]
+
+    def _leaf_digest(self, item: str) -> bytes:
+        digest = self._leaf_digests.get(item)
+        if digest is None:
+            digest = self._leaf_digests[item] = self.calculate_digest(item)
+        return digest
+
+    def _append_leaf(self, digest: bytes) -> None:
+        """Push one leaf into the frontier, merging perfect subtrees."""
+        forest = self._merkle_forest
+        forest.append((0, digest))
+        while len(forest) >= 2 and forest[-1][0] == forest[-2][0]:
+            depth, right = forest.pop()
+            _, left = forest.pop()
+            forest.append((depth + 1, _hash_pair(left + right)))
+
+    def _build_forest(self, leaves: List[bytes]) -> List[tuple]:
+        """Build the frontier for a fresh leaf set, level by level.
+
+        Leaves split into perfect subtrees (the binary decomposition of
+        N), so every level loop runs a fixed stride with no odd-tail
+        length check — odd-leaf duplication is deferred entirely to the
+        frontier fold, and each level goes through the batched
+        _hash_pairs seam.
+        """
+        forest: List[tuple] = []
+        n = len(leaves)
+        i = 0
+        bit = 1 << (n.bit_length() - 1)
+        while bit:
+            if n & bit:
+                level = leaves[i : i + bit]
+                depth = 0
+                while len(level) > 1:
+                    level = self._hash_pairs(
+                        [level[j] + level[j + 1] for j in range(0, len(level), 2)]
+                    )
+                    depth += 1
+                forest.append((depth, level[0]))
+                i += bit
+            bit >>= 1
+        return forest
+
+    def _frontier_root(self) -> bytes:
+        """Fold the frontier into the tree root.
+
+        This tree duplicates odd leaves rather than zero-padding, so the
+        precomputed zero-sibling table of the textbook incremental
+        algorithm becomes a duplication chain: a lone right-edge subtree
+        is promoted by hashing it with itself until it meets its left
+        sibling's depth.
+        """
+        forest = self._merkle_forest
+        depth, carry = forest[-1]
+        for d, root in forest[-2::-1]:
+            while depth < d:
+                carry = _hash_pair(carry + carry)
+                depth += 1
+            carry = _hash_pair(root + carry)
+            depth = d + 1
+        return carry
+
+    def calculate_merkle_root(self, items: List[str]) -> str:
+        """Merkle root over the given payloads, as a hex digest.
+
+        When the item list extends the one from the previous call — the
+        append-only transaction chain — only the new leaves are folded
+        in, costing O(log N) hashes instead of a full rebuild.
+        """
+        if not items:
+            return self.calculate_hash("")
+        n = len(self._merkle_items)
+        if len(items) >= n and items[:n] == self._merkle_items:
+            for item in items[n:]:
+                self._append_leaf(self._leaf_digest(item))
+        else:
+            self._merkle_forest = self._build_forest(
+                [self._leaf_digest(item) for item in items]
+            )
+        self._merkle_items = list(items)
+        return self._frontier_root().hex()
+
+    def create_transaction(self, operation: str, data: Dict[str, Any]) -> BlockchainTransaction:
+        """Build a fully resolved transaction chained onto the current tip."""
+        self.resolve()
+        timestamp = time.time_ns()
+        payload = _canonical(data)
+        data_hash = hashlib.sha256(payload).hexdigest()
+        # A single-leaf Merkle root is the leaf digest itself.
+        merkle_root = data_hash
+        previous_hash = self.chain[-1].data_hash if self.chain else GENESIS_HASH
+        tx_id = hashlib.sha256(
+            payload + str(timestamp).encode() + previous_hash.encode()
+        ).hexdigest()
+        return BlockchainTransaction(
+            tx_id=tx_id,
+            operation=operation,
+            data=data,
+            data_hash=data_hash,
+            previous_hash=previous_hash,
+            merkle_root=merkle_root,
+            timestamp=timestamp,
+        )
+
+    def add_transaction(self, transaction: BlockchainTransaction) -> None:
+        self.chain.append(transaction)
+        self.op_counts[transaction.operation] += 1
+
+    def record(self, operation: str, data: Dict[str, Any]) -> BlockchainTransaction:
+        """Append a transaction without hashing it yet.
+
+        Hashing is deferred off the write critical path; resolve() fills
+        the hash fields in lazily when a reader dereferences the chain.
+        Fully-resolved transactions from create_transaction still count
+        as resolved.
+        """
+        transaction = BlockchainTransaction(
+            tx_id="",
+            operation=operation,
+            data=data,
+            data_hash="",
+            previous_hash="",
+            merkle_root="",
+            timestamp=time.time_ns(),
+        )
+        self.chain.append(transaction)
+        self.op_counts[operation] += 1
+        return transaction
+
+    def resolve(self) -> None:
+        """Compute hash fields for any lazily appended transactions."""
+        chain = self.chain
+        for i in range(self._resolved, len(chain)):
+            tx = chain[i]
+            if not tx.data_hash:
+                payload = _canonical(tx.data)
+                tx.data_hash = hashlib.sha256(payload).hexdigest()
+                # A single-leaf Merkle root is the leaf digest itself;
+                # reuse it rather than resetting the incremental
+                # frontier.
+                tx.merkle_root = tx.data_hash
+                tx.previous_hash = chain[i - 1].data_hash if i else GENESIS_HASH
+                tx.tx_id = hashlib.sha256(
+                    payload + str(tx.timestamp).encode() + tx.previous_hash.encode()
+                ).hexdigest()
+            self._data_hash_col += bytes.fromhex(tx.data_hash)
+            self._prev_hash_col += bytes.fromhex(tx.previous_hash)
+        self._resolved = len(chain)
+
+
+class ProofEngine:
+    """Generates and finalizes content proofs for consolidation operations."""
+
+    def __init__(self, blockchain: Optional[BlockchainOrchestrator] = None):
+        self.blockchain = blockchain or BlockchainOrchestrator()
+        self.proofs: List[ConsolidationProof] = []
+        self._proof_index: Dict[str, ConsolidationProof] = {}
+        self.status_counts: collections.Counter = collections.Counter()
+
+    async def _hash_files(self, files: List[str]) -> tuple:
+        """Hash the given files once, in sorted order.
+
+        Returns (combined_hash, per_file_digests) from a single read
+        pass: the per-file digests fold into the combined hash and are
+        also what the chain record commits to, so no caller ever
+        re-reads a file to anchor it on the DLT.
+
+        Files are streamed and hashed concurrently in worker threads,
+        then their digests are folded into one hash — no mega-buffer
+        concatenation, and disk latency overlaps across files. The whole
+        batch is announced to the kernel up front (WILLNEED) so reads
+        start from warm pages, and a semaphore caps in-flight files to
+        bound open descriptors and memory.
+        """
+        ordered = sorted(files)
+        advise_readahead(ordered)
+        limit = asyncio.Semaphore(_IO_CONCURRENCY)
+
+        async def _one(filepath: str) -> bytes:
+            async with limit:
+                return await asyncio.to_thread(_hash_file, filepath)
+
+        digests = await asyncio.gather(*[_one(filepath) for filepath in ordered])
+        combined = hashlib.sha256()
+        for digest in digests:
+            combined.update(digest)
+        per_file = {
+            filepath: digest.hex() for filepath, digest in zip(ordered, digests)
+        }
+        return combined.hexdigest(), per_file
+
+    async def generate_consolidation_proof(self, operation: str, files: List[str]) -> ConsolidationProof:
+        """Snapshot the before-state of the files an operation will touch."""
+        before_hash, _ = await self._hash_files(files)
+        proof = ConsolidationProof(
+            proof_id=self.blockchain.calculate_hash(operation + before_hash),
+            operation=operation,
+            files=list(files),
+            before_hash=before_hash,
+            timestamp=time.time_ns(),
+        )
+        self.proofs.append(proof)
+        self._proof_index[proof.proof_id] = proof
+        self.status_counts[proof.status] += 1
+        return proof
+
+    async def finalize_proof(self, proof_id: str) -> Optional[ConsolidationProof]:
+        """Hash the after-state and anchor the proof on the chain."""
+        proof = self._proof_index.get(proof_id)
+        if proof is None:
+            return None
+        proof.after_hash, file_digests = await self._hash_files(proof.files)
+        self.status_counts[proof.status] -= 1
+        proof.status = "verified"
+        self.status_counts[proof.status] += 1
+        self.blockchain.record(
+            "consolidation_event",
+            {
+                "proof_id": proof.proof_id,
+                "operation": proof.operation,
+                "before_hash": proof.before_hash,
+                "after_hash": proof.after_hash,
+                "file_digests": file_digests,
+            },
+        )
+        return proof
+
+    def verify_integrity(self, proof_id: str) -> bool:
+        """Check that a proof exists and carries both content hashes."""
+        proof = self._proof_index.get(proof_id)
+        return proof is not None and proof.status == "verified" and bool(proof.after_hash)
+
+
+class TemporalCoordinator:
+    """Serializes multi-agent operations via per-agent locks."""
+
+    def __init__(self):
+        # Locked agents as a set: membership is the lock, and the
+        # check-and-acquire below runs without an await in between, so
+        # concurrent coordinate_operation calls cannot interleave it.
+        self._locked: set = set()
+
+    async def coordinate_operation(self, agents: List[str], operation) -> Any:
+        """Run an operation if all named agents are unlocked.
+
+        Returns False without running the operation when any named
+        agent is already locked by a concurrent coordination; callers
+        retry or skip rather than handle an exception.
+        """
+        if self._locked.intersection(agents):
+            return False
+        self._locked.update(agents)
+        try:
+            result = operation()
+            if asyncio.iscoroutine(result):
+                result = await result
+            return result
+        finally:
+            self._locked.difference_update(agents)
+
+
+class DLTOperations:
+    """Manifest and reporting layer over the chain and proof engine."""
+
+    MANIFEST_PATH = "state/blockchain_manifest.json"
+    REPORT_PATH = "state/consolidation_report.json"
+
+    def __init__(self, blockchain: Optional[BlockchainOrchestrator] = None,
+                 proof_engine: Optional[ProofEngine] = None):
+        self.blockchain = blockchain or BlockchainOrchestrator()
+        self.proof_engine = proof_engine or ProofEngine(self.blockchain)
+        # Last verification verdict and the chain length it covered
+        # (including the verification transaction it appended); reports
+        # on an unchanged chain reuse it instead of re-walking and
+        # re-recording.
+        self._verify_cache: Optional[bool] = None
+        self._verified_chain_len = -1
+
+    def verify_consolidation_chain(self) -> bool:
+        """Check every back-link in the chain.
+
+        The claimed and actual link hashes live in two contiguous
+        byte columns maintained by resolve(), so the whole-chain check
+        is one C-level compare of shifted views — no per-transaction
+        loop and no temporary join.
+        """
+        self.blockchain.resolve()
+        if len(self.blockchain.chain) < 2:
+            return True
+        claimed = memoryview(self.blockchain._prev_hash_col)[32:]
+        actual = memoryview(self.blockchain._data_hash_col)[:-32]
+        return claimed == actual
+
+    async def verify_consolidation_integrity(self) -> bool:
+        """Verify the chain and record the verification on it.
+
+        The verdict is cached; while the chain is unchanged since the
+        last verification, this neither re-walks the chain nor appends
+        another verification transaction, keeping report generation
+        O(1) on a quiet chain.
+        """
+        chain = self.blockchain.chain
+        if self._verify_cache is not None and len(chain) == self._verified_chain_len:
+            return self._verify_cache
+        valid = self.verify_consolidation_chain()
+        self.blockchain.record(
+            "integrity_verification",
+            {"chain_length": len(chain), "valid": valid},
+        )
+        self._verify_cache = valid
+        self._verified_chain_len = len(chain)
+        return valid
+
+    def update_blockchain_manifest(self) -> Dict[str, Any]:
+        """Write the current chain summary to state/."""
+        self.blockchain.resolve()
+        chain = self.blockchain.chain
+        manifest = {
+            "updated_at": datetime.now().isoformat(),
+            "chain_length": len(chain),
+            "consolidation_events": self.blockchain.op_counts["consolidation_event"],
+            "merkle_root": self.blockchain.calculate_merkle_root(
+                [tx.data_hash for tx in chain]
+            ),
+            "tip_hash": chain[-1].data_hash if chain else GENESIS_HASH,
+        }
+        os.makedirs("state", exist_ok=True)
+        Path(self.MANIFEST_PATH).write_bytes(_dump_pretty(manifest))
+        return manifest
+
+    async def get_consolidation_report(self) -> Dict[str, Any]:
+        """Summarize proofs and chain health, persisting the report."""
+        chain_valid = await self.verify_consolidation_integrity()
+        proofs = self.proof_engine.proofs
+        report = {
+            "generated_at": datetime.now().isoformat(),
+            "chain_valid": chain_valid,
+            "total_proofs": len(proofs),
+            "verified_proofs": self.proof_engine.status_counts["verified"],
+            "pending_proofs": self.proof_engine.status_counts["pending"],
+            "manifest": self.update_blockchain_manifest(),
+        }
+        os.makedirs("state", exist_ok=True)
+        Path(self.REPORT_PATH).write_bytes(_dump_pretty(report))
+        return report
+
+
+app = typer.Typer()
+
+
+@app.command()
+def report():
+    """Generate and print the consolidation report."""
+    dlt = DLTOperations()
+    result = asyncio.run(dlt.get_consolidation_report())
+    print(json.dumps(result, indent=2))
+
+
+@app.command()
+def prove(files: List[str]):
+    """Generate and finalize a proof over the given files."""
+    dlt = DLTOperations()
+
+    async def _run():
+        proof = await dlt.proof_engine.generate_consolidation_proof("manual_proof", files)
+        await dlt.proof_engine.finalize_proof(proof.proof_id)
+        return proof
+
+    proof = asyncio.run(_run())
+    record = asdict(proof)
+    record["timestamp"] = _iso(record["timestamp"])
+    print(json.dumps(record, indent=2))
+
+
+if __name__ == "__main__":
+    app()
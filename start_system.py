@@ -0,0 +1,61 @@
+"""Launcher for the CTR consolidation stack.
+
+Checks that the agent scripts and working directories are in place,
+prepares the environment, and hands off to mission control.
+"""
+
+import asyncio
+import os
+
+import typer
+
+from mission_control import (
+    REQUIRED_DIRS,
+    MissionControlCenter,
+    _setup_logging,
+    ensure_directories,
+)
+
+REQUIRED_FILES = [
+    "file_deduplicator.py",
+    "consolidation_agent.py",
+    "proof_engine.py",
+    "mission_control.py",
+]
+
+
+def check_requirements() -> bool:
+    """Verify the agent scripts and expected directories exist.
+
+    One scandir of the working directory replaces a stat per required
+    path; the required sets are intersected with the single listing.
+    """
+    with os.scandir(".") as entries:
+        present = {entry.name for entry in entries}
+    ok = True
+    for file_path in REQUIRED_FILES:
+        if file_path not in present:
+            print(f"Missing required file: {file_path}")
+            ok = False
+    for directory in REQUIRED_DIRS:
+        if directory not in present:
+            print(f"Missing directory (will be created): {directory}")
+    return ok
+
+
+def setup_environment() -> None:
+    """Create the working directories mission control expects."""
+    ensure_directories(REQUIRED_DIRS)
+
+
+def main():
+    """Check requirements, prepare the environment, start mission control."""
+    if not check_requirements():
+        raise typer.Exit(code=1)
+    setup_environment()
+    _setup_logging()
+    asyncio.run(MissionControlCenter().run())
+
+
+if __name__ == "__main__":
+    typer.run(main)